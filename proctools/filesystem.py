@@ -2,20 +2,31 @@
 from collections import Counter
 from contextlib import ContextDecorator
 from datetime import datetime as _datetime
+from errno import EBADF, ELOOP, ENOENT, ENOTDIR
 from filecmp import cmp
+from hashlib import blake2b
 from logging import DEBUG, INFO, WARNING, Logger, getLogger
+import os
 from pathlib import Path
-from shutil import copy2
-from stat import S_IWRITE
+import re
+from shutil import copy2, copyfileobj
+from stat import S_ISREG, S_IWRITE
+from string import punctuation, whitespace
 import subprocess
 from types import TracebackType
-from typing import Iterable, Iterator, Optional, Type, TypeVar, Union
-from zipfile import ZIP_DEFLATED, BadZipfile, ZipFile
-
-from more_itertools import pairwise
+from typing import (
+    Callable,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+from zipfile import ZIP_DEFLATED, ZIP_STORED, BadZipfile, ZipFile, ZipInfo
 
 from proctools.misc import log_entity_states, time_elapsed
-from proctools.value import slugify
 
 
 __all__ = []
@@ -23,6 +34,43 @@ __all__ = []
 LOG: Logger = getLogger(__name__)
 """Module-level logger."""
 
+ARCHIVE_COPY_BUFFER_SIZE: int = 1024 * 1024
+"""Size in bytes of buffer & chunks to copy file contents into an archive with."""
+ARCHIVE_SMALL_FILE_SIZE: int = 64 * 1024
+"""Maximum size in bytes of a file to read whole into an archive, not stream."""
+COMPRESSED_FILE_EXTENSIONS: FrozenSet[str] = frozenset(
+    [
+        ".7z",
+        ".bz2",
+        ".docx",
+        ".flac",
+        ".gif",
+        ".gz",
+        ".jpeg",
+        ".jpg",
+        ".mp3",
+        ".mp4",
+        ".pdf",
+        ".png",
+        ".pptx",
+        ".webm",
+        ".webp",
+        ".xlsx",
+        ".xz",
+        ".zip",
+    ]
+)
+"""Extensions of already-compressed file types, stored in archives as-is."""
+FILE_DIGEST_CHUNK_SIZE: int = 1024 * 1024
+"""Size in bytes of chunks to read file contents with for digests."""
+IGNORED_STAT_ERRNOS: FrozenSet[int] = frozenset([EBADF, ELOOP, ENOENT, ENOTDIR])
+"""Error numbers meaning a path is not there to stat (as ignored by `pathlib`)."""
+IGNORED_STAT_WINERRORS: FrozenSet[int] = frozenset([21, 123, 1921])
+"""Windows error codes meaning a path is not there to stat (as ignored by `pathlib`).
+
+21: Device not ready. 123: Invalid name. 1921: Symbolic link cannot be followed.
+"""
+
 # Py3.7: Can replace usage with `typing.Self` in Py3.11.
 TNetUse = TypeVar("TNetUse", bound="NetUse")
 """Type variable to enable method return of self on NetUse."""
@@ -72,16 +120,17 @@ class NetUse(ContextDecorator):
 
     def connect(self) -> None:
         """Connect to resource."""
-        args = f"""net use "{self.unc_path_str}\""""
+        # Argument list, not interpolated command string: subprocess handles quoting.
+        args = ["net", "use", self.unc_path_str]
         if self.__password:
-            args += f" {self.__password}"
+            args.append(self.__password)
         if self.__username:
-            args += f""" /user:"{self.__username}\""""
+            args.append(f"/user:{self.__username}")
         subprocess.run(args=args, check=True)
 
     def disconnect(self) -> None:
         """Disconnect resource."""
-        args = f"""net use "{self.unc_path_str}" /delete"""
+        args = ["net", "use", self.unc_path_str, "/delete"]
         try:
             subprocess.run(args=args, check=True)
         except subprocess.CalledProcessError as disconnect_error:
@@ -89,12 +138,102 @@ class NetUse(ContextDecorator):
                 LOG.debug("Network resource `%s` already disconnected.", self.unc_path)
 
 
+def _file_digest(filepath: Path) -> bytes:
+    """Return digest of given file's contents.
+
+    Args:
+        filepath: Path to file.
+    """
+    digest = blake2b(digest_size=16)
+    with filepath.open(mode="rb") as file:
+        for chunk in iter(lambda: file.read(FILE_DIGEST_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _folder_filepaths(
+    folder_path: str,
+    *,
+    file_extensions: Optional[FrozenSet[str]],
+    top_level_only: bool,
+    skip_folder: Optional[Callable[[str], bool]] = None,
+) -> Iterator[str]:
+    """Generate path strings to files in given folder.
+
+    Args:
+        folder_path: Path to folder.
+        file_extensions: Collection of casefolded file extensions for files to include
+            in generator. If None or empty, will include all files.
+        top_level_only: Only yield paths for files at top-level if True. Include
+            subfolders as well if False.
+        skip_folder: Function taking a subfolder path, returning True if the subfolder
+            should not be walked. If None, will walk all subfolders.
+    """
+    # Directory entries carry cached file types & names; no Path objects or stat calls.
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                if not file_extensions or _suffix(entry.name) in file_extensions:
+                    yield entry.path
+
+            elif entry.is_dir() and not top_level_only:
+                if skip_folder and skip_folder(entry.path):
+                    continue
+
+                yield from _folder_filepaths(
+                    entry.path,
+                    file_extensions=file_extensions,
+                    top_level_only=top_level_only,
+                    skip_folder=skip_folder,
+                )
+
+
+def _path_prefix_length(folder_path: str) -> int:
+    """Return length of folder path prefix on path strings generated from the folder.
+
+    Args:
+        folder_path: Path to folder, as passed to `_folder_filepaths`.
+    """
+    # Directory entry paths are joined onto the folder path string as given.
+    return len(os.path.join(folder_path, ""))
+
+
+def _safe_stat(path: Union[Path, str]) -> Optional[os.stat_result]:
+    """Return stat result for given path, or None if path does not exist.
+
+    Args:
+        path: Path to file or folder.
+    """
+    try:
+        return os.stat(path)
+    # Same errors `Path.is_file` & co. treat as the path not existing.
+    except OSError as error:
+        if (
+            error.errno in IGNORED_STAT_ERRNOS
+            or getattr(error, "winerror", None) in IGNORED_STAT_WINERRORS
+        ):
+            return None
+
+        raise
+
+
+def _suffix(name: str) -> str:
+    """Return casefolded file extension of given file name, matching `Path.suffix`.
+
+    Args:
+        name: Name of file.
+    """
+    i = name.rfind(".")
+    return name[i:].casefold() if 0 < i < len(name) - 1 else ""
+
+
 def archive_folder(
     folder_path: Union[Path, str],
     *,
     archive_path: Union[Path, str],
     exclude_patterns: Optional[Iterable[str]] = None,
     include_base_folder: bool = False,
+    compress_level: int = 1,
 ) -> Path:
     """Create zip archive of files in the given folder.
 
@@ -104,25 +243,75 @@ def archive_folder(
         exclude_patterns (iter): Collection of file/folder name patterns to
             exclude from archive.
         include_base_folder: If True file archive paths will include the base folder.
+        compress_level: Deflate compression level, from 1 (fastest) to 9 (smallest).
 
     Returns:
         Path to archive.
     """
     folder_path = Path(folder_path)
     archive_path = Path(archive_path)
-    exclude_patterns = list(exclude_patterns) if exclude_patterns else []
-    with ZipFile(archive_path, mode="w", compression=ZIP_DEFLATED) as archive:
-        for filepath in folder_filepaths(folder_path):
-            if any(
-                pattern.casefold() in str(filepath.relative_to(folder_path)).casefold()
-                for pattern in exclude_patterns
-            ):
+    # Materialize first: an empty iterator is truthy, but must exclude nothing.
+    exclude_patterns = [pattern.casefold() for pattern in exclude_patterns or []]
+    # Single compiled alternation scans each path once, regardless of pattern count.
+    exclude_regex = (
+        re.compile("|".join(re.escape(pattern) for pattern in exclude_patterns))
+        if exclude_patterns
+        else None
+    )
+    # Slicing path strings avoids building Path objects for relative paths per file.
+    folder_path_str = str(folder_path)
+    folder_prefix_length = _path_prefix_length(folder_path_str)
+    if include_base_folder and folder_path.name:
+        archive_prefix_length = folder_prefix_length - len(folder_path.name) - 1
+    else:
+        archive_prefix_length = folder_prefix_length
+
+    def _is_excluded(path: str) -> bool:
+        """Return True if path relative to folder matches an exclude pattern."""
+        return bool(exclude_regex.search(path[folder_prefix_length:].casefold()))
+
+    with ZipFile(
+        archive_path,
+        mode="w",
+        compression=ZIP_DEFLATED,
+        compresslevel=compress_level,
+    ) as archive:
+        for filepath in _folder_filepaths(
+            folder_path_str,
+            file_extensions=None,
+            top_level_only=False,
+            # Files in a folder matching a pattern would match too; skip walking it.
+            skip_folder=_is_excluded if exclude_regex else None,
+        ):
+            if exclude_regex and _is_excluded(filepath):
                 continue
 
-            archive_filepath = filepath.relative_to(
-                folder_path.parent if include_base_folder else folder_path
+            archive_filepath = filepath[archive_prefix_length:]
+            file_info = ZipInfo.from_file(filepath, arcname=archive_filepath)
+            file_info.compress_type = (
+                ZIP_STORED
+                if _suffix(os.path.basename(filepath)) in COMPRESSED_FILE_EXTENSIONS
+                else ZIP_DEFLATED
             )
-            archive.write(filename=filepath, arcname=archive_filepath)
+            # Archive compress level only applies to entries the archive creates itself.
+            # Py3.12: Attribute is public as `compress_level` in Py3.13.
+            # pylint: disable=protected-access
+            file_info._compresslevel = compress_level
+            # pylint: enable=protected-access
+            # Small files: a single unbuffered read is cheaper than buffered streaming.
+            if file_info.file_size <= ARCHIVE_SMALL_FILE_SIZE:
+                with open(filepath, mode="rb", buffering=0) as file:
+                    archive.writestr(file_info, file.read())
+                continue
+
+            # ZipFile.write reads & copies in 8 KiB chunks; larger chunks mean fewer
+            # read calls per file.
+            file = open(filepath, mode="rb", buffering=ARCHIVE_COPY_BUFFER_SIZE)
+            # Forcing ZIP64 up front means a file growing mid-copy cannot overflow
+            # the entry header's size fields.
+            archive_file = archive.open(file_info, mode="w", force_zip64=True)
+            with file, archive_file:
+                copyfileobj(file, archive_file, length=ARCHIVE_COPY_BUFFER_SIZE)
     return archive_path
 
 
@@ -153,6 +342,23 @@ def extract_archive(
     """
     archive_path = Path(archive_path)
     extract_path = Path(extract_path)
+    # Native unzip is much faster on many-entry archives. Not used with a password, as
+    # that would expose it in the process arguments.
+    if not password:
+        try:
+            # Py3.7: Convert Path to str.
+            subprocess.run(
+                args=["unzip", "-qq", "-o", str(archive_path), "-d", str(extract_path)],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        # Fall back to zipfile if unzip is not installed or fails.
+        except (FileNotFoundError, subprocess.CalledProcessError):
+            pass
+        else:
+            return True
+
     try:
         with ZipFile(archive_path, "r") as archive:
             archive.extractall(extract_path, pwd=password)
@@ -173,14 +379,14 @@ def get_flattened_path_string(
         path: Path.
         separator_replacement: String to replace separators with.
     """
-    path = slugify(str(path), separator=separator_replacement, force_lowercase=False)
-    while separator_replacement * 2 in path:
-        path = path.replace(separator_replacement * 2, separator_replacement)
-    while path.startswith(separator_replacement) or path.endswith(
-        separator_replacement
-    ):
-        path = path.strip(separator_replacement)
-    return path
+    # Single pass each to replace, collapse, then strip separators.
+    path = str(path).translate(
+        str.maketrans(dict.fromkeys(punctuation + whitespace, separator_replacement))
+    )
+    path = re.sub(
+        f"(?:{re.escape(separator_replacement)})+", separator_replacement, path
+    )
+    return path.strip(separator_replacement)
 
 
 def folder_filepaths(
@@ -199,20 +405,12 @@ def folder_filepaths(
         top_level_only: Only yield paths for files at top-level if True. Include
             subfolders as well if False.
     """
-    folder_path = Path(folder_path)
     if file_extensions:
-        file_extensions = {ext.casefold() for ext in file_extensions}
-    for child_path in folder_path.iterdir():
-        if child_path.is_file():
-            if not file_extensions or child_path.suffix.casefold() in file_extensions:
-                yield child_path
-
-        elif child_path.is_dir() and not top_level_only:
-            yield from folder_filepaths(
-                child_path,
-                file_extensions=file_extensions,
-                top_level_only=top_level_only,
-            )
+        file_extensions = frozenset(ext.casefold() for ext in file_extensions)
+    for filepath in _folder_filepaths(
+        str(folder_path), file_extensions=file_extensions, top_level_only=top_level_only
+    ):
+        yield Path(filepath)
 
 
 def same_file(*filepaths: Union[Path, str], not_exists_ok: bool = True) -> bool:
@@ -225,7 +423,10 @@ def same_file(*filepaths: Union[Path, str], not_exists_ok: bool = True) -> bool:
             a file and as "different" than any actual files.
     """
     filepaths = {Path(filepath) for filepath in filepaths}
-    if any(not filepath.is_file() for filepath in filepaths):
+    file_stats = [_safe_stat(filepath) for filepath in filepaths]
+    if any(
+        file_stat is None or not S_ISREG(file_stat.st_mode) for file_stat in file_stats
+    ):
         if not_exists_ok:
             same = False
         else:
@@ -235,11 +436,14 @@ def same_file(*filepaths: Union[Path, str], not_exists_ok: bool = True) -> bool:
 
     elif len(filepaths) <= 1:
         same = True
+    elif len(filepaths) == 2:
+        same = cmp(*filepaths)
+    # Differing sizes mean differing files; no need to compare contents.
+    elif len({file_stat.st_size for file_stat in file_stats}) > 1:
+        same = False
+    # Reading each file once for a digest beats pairwise comparisons rereading files.
     else:
-        same = all(
-            cmp(filepath, cmp_filepath)
-            for filepath, cmp_filepath in pairwise(filepaths)
-        )
+        same = len({_file_digest(filepath) for filepath in filepaths}) == 1
     return same
 
 
@@ -258,15 +462,18 @@ def update_file(
     """
     filepath = Path(filepath)
     source_filepath = Path(source_filepath)
-    if not source_filepath.is_file():
+    source_stat = _safe_stat(source_filepath)
+    if source_stat is None or not S_ISREG(source_stat.st_mode):
         raise FileNotFoundError(f"Source file '{source_filepath}` not extant file.")
 
-    if filepath.exists():
-        if same_file(filepath, source_filepath):
+    file_stat = _safe_stat(filepath)
+    if file_stat is not None:
+        # Differing sizes mean differing files; no need to compare contents.
+        if file_stat.st_size == source_stat.st_size and cmp(filepath, source_filepath):
             result = "no update necessary"
         else:
             # Make destination file overwriteable.
-            if filepath.exists():
+            if not file_stat.st_mode & S_IWRITE:
                 filepath.chmod(mode=S_IWRITE)
             try:
                 copy2(source_filepath, filepath)
@@ -284,7 +491,9 @@ def update_file(
         else:
             result = "created"
     if result in ["created", "updated"]:
-        filepath.chmod(mode=S_IWRITE)
+        # Copy carries over source permissions; only need to fix read-only sources.
+        if not source_stat.st_mode & S_IWRITE:
+            filepath.chmod(mode=S_IWRITE)
         log_level = INFO
     elif "failed to" in result:
         log_level = WARNING
@@ -335,17 +544,36 @@ def update_replica_folder(
         if not dirpath.is_dir():
             raise FileNotFoundError(f"`{dirpath}` not accessible folder")
 
-    source_filepaths = folder_filepaths(
-        source_path, file_extensions=file_extensions, top_level_only=top_level_only
+    if file_extensions:
+        file_extensions = frozenset(ext.casefold() for ext in file_extensions)
+    # Plain string operations avoid building several Path objects per file.
+    folder_path_str = str(folder_path)
+    source_path_str = str(source_path)
+    source_filepaths = list(
+        _folder_filepaths(
+            source_path_str,
+            file_extensions=file_extensions,
+            top_level_only=top_level_only,
+        )
     )
+    if flatten_tree:
+        filepaths = [
+            os.path.join(folder_path_str, os.path.basename(source_filepath))
+            for source_filepath in source_filepaths
+        ]
+    else:
+        source_prefix_length = _path_prefix_length(source_path_str)
+        filepaths = [
+            os.path.join(folder_path_str, source_filepath[source_prefix_length:])
+            for source_filepath in source_filepaths
+        ]
+        # Add folders (if necessary) once each, rather than once per file.
+        for dirpath in sorted({os.path.dirname(filepath) for filepath in filepaths}):
+            os.makedirs(dirpath, exist_ok=True)
     states = Counter()
-    for i, source_filepath in enumerate(source_filepaths, start=1):
-        if flatten_tree:
-            filepath = folder_path / source_filepath.name
-        else:
-            filepath = folder_path / source_filepath.relative_to(source_path)
-            # Add folder (if necessary).
-            filepath.parent.mkdir(parents=True, exist_ok=True)
+    for i, (filepath, source_filepath) in enumerate(
+        zip(filepaths, source_filepaths), start=1
+    ):
         states[update_file(filepath, source_filepath=source_filepath)] += 1
         if log_evaluated_division and i % log_evaluated_division == 0:
             logger.info("Evaluated %s files.", format(i, ",d"))
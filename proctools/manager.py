@@ -1,6 +1,7 @@
 """Process manager objects."""
 from argparse import ArgumentParser
 from datetime import datetime as _datetime
+from functools import lru_cache
 from logging import (
     DEBUG,
     INFO,
@@ -13,7 +14,7 @@ from logging import (
 from operator import itemgetter
 from os import environ
 from pathlib import Path
-from sqlite3 import connect
+from sqlite3 import PARSE_COLNAMES, Connection, connect, register_converter
 from types import FunctionType
 from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Union
 
@@ -42,6 +43,65 @@ RUN_RESULTS_DB_PATH: Path = LOGS_PATH / "Run_Results.sqlite3"
 
 RUN_STATUS_DESCRIPTION: Dict[int, str] = {1: "complete", 0: "failed", -1: "incomplete"}
 """Mapping of status number to description."""
+TEMPLATE_ENVIRONMENT: Environment = Environment(
+    loader=PackageLoader("proctools", "templates"), auto_reload=False
+)
+"""Template environment for package templates.
+
+Shared so that loaded templates are cached across uses.
+"""
+
+PIPELINE_LOG_FORMATTER: Formatter = Formatter(
+    fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+"""Formatter for pipeline loglines."""
+PIPELINE_CONSOLE_HANDLER: StreamHandler = StreamHandler()
+"""Console handler for pipeline loggers, shared across pipeline members."""
+PIPELINE_CONSOLE_HANDLER.setLevel(INFO)
+PIPELINE_CONSOLE_HANDLER.setFormatter(PIPELINE_LOG_FORMATTER)
+
+
+def _convert_timestamp(value: bytes) -> Union[_datetime, None]:
+    """Return datetime from run results database timestamp text.
+
+    No sqlite3 date/time types; timestamps are stored as ISO-format text.
+
+    Args:
+        value: Timestamp text value.
+    """
+    value = value.decode()
+    try:
+        return _datetime.fromisoformat(value)
+
+    # Fall back to lenient parsing for anything not written in ISO format.
+    except ValueError:
+        return datetime_from_string(value)
+
+
+register_converter("proctools_timestamp", _convert_timestamp)
+
+
+@lru_cache(maxsize=1)
+def _connect_run_results() -> Connection:
+    """Return connection to run results database, tuned for frequent small access.
+
+    Connection is opened once & shared by all batch & job instances in the process.
+    """
+    conn = connect(
+        RUN_RESULTS_DB_PATH, detect_types=PARSE_COLNAMES, check_same_thread=False
+    )
+    # Write-ahead log lets reads proceed alongside writes & syncs less often.
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA busy_timeout = 5000;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    return conn
+
+
+@lru_cache(maxsize=1)
+def _create_logs_folder() -> None:
+    """Create logs folder if missing. Only checks once per process."""
+    LOGS_PATH.mkdir(parents=True, exist_ok=True)
 
 
 class Batch:
@@ -54,6 +114,10 @@ class Batch:
     """ID for batch, as found in Batch table of the run results database."""
     name: str
     """Name of the batch."""
+    _job_names: Optional[List[str]] = None
+    """Cached names of jobs in the batch."""
+    _notification_addresses: Optional[Dict[str, List[str]]] = None
+    """Cached mapping of type to list of email addresses for notification."""
 
     def __init__(self, name: str) -> None:
         """Initialize instance.
@@ -62,7 +126,7 @@ class Batch:
             name: Name of the batch.
         """
         self.name = name
-        self._conn = connect(RUN_RESULTS_DB_PATH)
+        self._conn = _connect_run_results()
 
         with self._conn:
             cursor = self._conn.cursor()
@@ -71,47 +135,57 @@ class Batch:
 
     @property
     def job_names(self) -> List[str]:
-        """Names of jobs in the batch."""
+        """Names of jobs in the batch.
+
+        Names are queried once per instance, then reused.
+        """
+        if self._job_names is not None:
+            return self._job_names
+
         with self._conn:
             cursor = self._conn.cursor()
             cursor.execute("SELECT name FROM Job WHERE batch_id = ?;", [self.batch_id])
-            return [name for name, in cursor.fetchall()]
+            self._job_names = [name for name, in cursor.fetchall()]
+            return self._job_names
 
     @property
     def job_last_run_records(self) -> List[Dict[str, Union[_datetime, int, str]]]:
         """List of dictionaries for last run records for jobs in the batch."""
         with self._conn:
             cursor = self._conn.cursor()
-            cursor.execute(
-                "SELECT * FROM Last_Job_Run WHERE batch_id = ?;", [self.batch_id]
-            )
-            records = [
-                {column[0]: value for column, value in zip(cursor.description, row)}
-                for row in cursor
-            ]
-            # Coerce timestamps to datetime--no sqlite3 date/time types, using text.
-            for record in records:
-                for key in ["start_time", "end_time"]:
-                    record[key] = datetime_from_string(record[key])
+            # Timestamp columns re-selected with converter type, replacing originals.
+            sql = """
+                SELECT
+                    *,
+                    start_time AS 'start_time [proctools_timestamp]',
+                    end_time AS 'end_time [proctools_timestamp]'
+                FROM Last_Job_Run
+                WHERE batch_id = ?;
+            """
+            cursor.execute(sql, [self.batch_id])
+            columns = [column[0] for column in cursor.description]
+            records = [dict(zip(columns, row)) for row in cursor]
         return records
 
     @property
     def job_last_run_start_times(self) -> Set[_datetime]:
         """Set of last-run start times for jobs in the batch."""
-        with self._conn:
-            cursor = self._conn.cursor()
-            cursor.execute(
-                "SELECT start_time FROM Last_Job_Run WHERE batch_id = ?;",
-                [self.batch_id],
-            )
-            times = {datetime_from_string(start_time) for start_time, in cursor}
-            if None in times:
-                times.remove(None)
-        return times
+        # Derived from the records fetch, so last-run rows are read in one place.
+        return {
+            record["start_time"]
+            for record in self.job_last_run_records
+            if record["start_time"] is not None
+        }
 
     @property
     def notification_addresses(self) -> Dict[str, List[str]]:
-        """Mapping of type to list of email addresses for notification."""
+        """Mapping of type to list of email addresses for notification.
+
+        Addresses are queried once per instance, then reused.
+        """
+        if self._notification_addresses is not None:
+            return self._notification_addresses
+
         with self._conn:
             cursor = self._conn.cursor()
             sql = """
@@ -128,21 +202,25 @@ class Batch:
             if not row:
                 raise ValueError("Batch name not valid member of Batch table.")
 
-            addresses = {
+            self._notification_addresses = {
                 column[0]: list(extract_email_addresses(value))
                 for column, value in zip(cursor.description, row)
             }
-            return addresses
+            return self._notification_addresses
 
     @property
     def status(self) -> int:
         """Status code for current batch run."""
         with self._conn:
             cursor = self._conn.cursor()
-            cursor.execute(
-                "SELECT status FROM Last_Job_Run WHERE batch_id = ?;", [self.batch_id]
-            )
-            return 1 if all(status == 1 for status, in cursor) else -1
+            # Complete only if no job's last run is anything but complete.
+            sql = """
+                SELECT NOT EXISTS (
+                    SELECT 1 FROM Last_Job_Run WHERE batch_id = ? AND status IS NOT 1
+                );
+            """
+            all_complete = cursor.execute(sql, [self.batch_id]).fetchone()[0]
+            return 1 if all_complete else -1
 
     @property
     def status_description(self) -> str:
@@ -165,25 +243,29 @@ class Batch:
             port: Port to connect to SMTP host on.
             password: Password for authentication with host.
         """
+        notification_addresses = self.notification_addresses
         if not any(
             addresses
-            for key, addresses in self.notification_addresses.items()
+            for key, addresses in notification_addresses.items()
             if key in ["to_addresses", "copy_addresses", "blind_copy_addresses"]
         ):
             LOG.info("No recipients for notification; not sending.")
             return
 
-        env = Environment(loader=PackageLoader("proctools", "templates"))
-        template = env.get_template("batch_notification.html")
+        template = TEMPLATE_ENVIRONMENT.get_template("batch_notification.html")
         records = sorted(
             self.job_last_run_records,
             key=itemgetter("start_time", "end_time"),
             reverse=True,
         )
+        # Derive status from the fetched records rather than querying for it again.
+        status = 1 if all(record["status"] == 1 for record in records) else -1
         send_email_smtp(
             from_address=from_address,
-            **self.notification_addresses,
-            subject=f"Processing Batch: {self.name} ({self.status_description})",
+            **notification_addresses,
+            subject=(
+                f"Processing Batch: {self.name} ({RUN_STATUS_DESCRIPTION[status]})"
+            ),
             body=template.render(job_last_run_records=records),
             body_type="html",
             host=host,
@@ -221,7 +303,7 @@ class Job:
         """
         self.name = name
         self.procedures = list(procedures) if procedures is not None else []
-        self._conn = connect(RUN_RESULTS_DB_PATH)
+        self._conn = _connect_run_results()
         with self._conn:
             cursor = self._conn.cursor()
             cursor.execute("SELECT id FROM Job WHERE name = ?;", [self.name])
@@ -250,17 +332,11 @@ class Job:
         if self.run_id is None:
             start_time = _datetime.now().isoformat(" ")
             with self._conn:
-                self._conn.execute(
+                cursor = self._conn.execute(
                     "INSERT INTO Job_Run(status, job_id, start_time) VALUES (?, ?, ?);",
                     [value, self.job_id, start_time],
                 )
-            with self._conn:
-                cursor = self._conn.cursor()
-                cursor.execute(
-                    "SELECT id FROM Job_Run WHERE job_id = ? AND start_time = ?;",
-                    [self.job_id, start_time],
-                )
-                self.run_id = cursor.fetchone()[0]
+                self.run_id = cursor.lastrowid
         else:
             end_time = None if value == -1 else _datetime.now().isoformat(" ")
             with self._conn:
@@ -289,21 +365,18 @@ class Pipeline:
         """
         logger = getLogger()
         logger.setLevel(INFO)
-        formatter = Formatter(
-            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
         # Need to remove old handlers, to avoid duplicating handlers between procedures.
-        for handler in logger.handlers:
+        # Iterate over a copy: removing from the list being iterated skips handlers.
+        for handler in list(logger.handlers):
             logger.removeHandler(handler)
-        console_handler = StreamHandler()
-        console_handler.setLevel(INFO)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-        LOGS_PATH.mkdir(parents=True, exist_ok=True)
+            if isinstance(handler, FileHandler):
+                handler.close()
+        logger.addHandler(PIPELINE_CONSOLE_HANDLER)
+        _create_logs_folder()
         log_path = LOGS_PATH / f"{member_name}.log"
         file_handler = FileHandler(filename=log_path, mode=file_mode)
         file_handler.setLevel(file_level)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(PIPELINE_LOG_FORMATTER)
         logger.addHandler(file_handler)
         return logger
 
@@ -1,18 +1,40 @@
 """Media (images, documents) processing objects."""
-from collections import Counter
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
 from datetime import datetime as _datetime
-from logging import INFO, Logger, getLogger
+from functools import partial
+from io import SEEK_END, BytesIO
+from itertools import islice
+from logging import INFO, Handler, Logger, LogRecord, getLogger
+from logging.handlers import QueueHandler, QueueListener
+from mmap import ACCESS_READ, mmap
+from multiprocessing import Queue
+from os import cpu_count
 from pathlib import Path
-import shutil
+import re
+from stat import S_ISREG
 import subprocess
 import tempfile
-from time import sleep
-from typing import Iterable, List, Optional, Sequence, Union
+from time import monotonic, sleep
+from typing import (
+    BinaryIO,
+    Callable,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Union,
+)
 
 from img2pdf import convert
 from pdfid_PL import PDFiD as pdfid
 from PIL import Image, ImageFile, ImageSequence
 
+from proctools.filesystem import _safe_stat
 from proctools.misc import log_entity_states, time_elapsed
 
 
@@ -21,36 +43,96 @@ __all__ = []
 LOG: Logger = getLogger(__name__)
 """Module-level logger."""
 
-IMAGE_FILE_EXTENSIONS: List[str] = [
-    ".bmp",
-    ".dcx",
-    ".emf",
-    ".gif",
-    ".jp2",
-    ".jpg",
-    ".jpeg",
-    ".pcd",
-    ".pcx",
-    ".pic",
-    ".png",
-    ".psd",
-    ".tga",
-    ".tif",
-    ".tiff",
-    ".wmf",
-]
-"""Collection of known image file extensions."""
-WORLD_FILE_EXTENSIONS: List[str] = [
-    ".j2w",
-    ".jgw",
-    ".jpgw",
-    ".pgw",
-    ".pngw",
-    ".tfw",
-    ".tifw",
-    ".wld",
-]
-"""Collection of known image world file extensions."""
+IMAGE_FILE_EXTENSIONS: FrozenSet[str] = frozenset(
+    [
+        ".bmp",
+        ".dcx",
+        ".emf",
+        ".gif",
+        ".jp2",
+        ".jpg",
+        ".jpeg",
+        ".pcd",
+        ".pcx",
+        ".pic",
+        ".png",
+        ".psd",
+        ".tga",
+        ".tif",
+        ".tiff",
+        ".wmf",
+    ]
+)
+"""Collection of known image file extensions (lowercase)."""
+WORLD_FILE_EXTENSIONS: FrozenSet[str] = frozenset(
+    [
+        ".j2w",
+        ".jgw",
+        ".jpgw",
+        ".pgw",
+        ".pngw",
+        ".tfw",
+        ".tifw",
+        ".wld",
+    ]
+)
+"""Collection of known image world file extensions (lowercase)."""
+
+ACTIVE_CONTENT_PATTERN: Pattern[bytes] = re.compile(
+    rb"/(?:"
+    + rb"|".join(
+        # Keywords can be hidden by hex-escaping any character (e.g. `#4A` for `J`).
+        b"".join(b"(?:%c|#(?i:%02x))" % (char, char) for char in name)
+        for name in [
+            b"AA",
+            b"AcroForm",
+            b"EmbeddedFile",
+            b"JBIG2Decode",
+            b"JS",
+            b"JavaScript",
+            b"Launch",
+            b"OpenAction",
+            b"RichMedia",
+            b"XFA",
+        ]
+    )
+    # pdfid ends a name at the first character that is not alphanumeric.
+    + rb")(?![0-9A-Za-z])"
+)
+"""Pattern for PDF names of potentially active content (as flagged by pdfid)."""
+IMAGE2PDF_PATH: Path = (
+    Path(__file__).parent.parent / "resources\\apps\\Image2PDF\\image2pdf.exe"
+)
+"""Path to Image2PDF command-line tool."""
+
+
+class _LogRecordForwarder(Handler):
+    """Handler passing log records on to the same-named logger in this process.
+
+    Used to hand log records from worker processes to the caller's handlers.
+    """
+
+    def emit(self, record: LogRecord) -> None:
+        """Pass record on to the logger of the same name, if enabled for its level.
+
+        Args:
+            record: Log record.
+        """
+        logger = getLogger(record.name)
+        if logger.isEnabledFor(record.levelno):
+            logger.handle(record)
+
+
+def _apply_to_paths(
+    function: Callable[[Union[Path, str]], str], paths: List[Union[Path, str]]
+) -> List[str]:
+    """Return results of function applied to each path, in order of paths.
+
+    Args:
+        function: Function to apply to each path.
+        paths: Paths to apply function to.
+    """
+    return [function(path) for path in paths]
 
 
 def _cmd_convert_image_to_pdf(
@@ -74,30 +156,42 @@ def _cmd_convert_image_to_pdf(
     """
     image_path = Path(image_path)
     output_path = Path(output_path)
-    image2pdf_path: Path = (
-        Path(__file__).parent.parent / "resources\\apps\\Image2PDF\\image2pdf.exe"
-    )
-    subprocess.run(
-        args=[
-            image2pdf_path,
-            "-r",
-            "EUIEUFBFYUOQVPAT",
-            "-i",
-            image_path,
-            "-o",
-            output_path,
-            "-g",
-            "overwrite",
-        ],
-        check=True,
-    )
+    # Py3.7: Convert Path to str.
+    # Tool output is discarded, so the child does not share the console buffers.
+    try:
+        subprocess.run(
+            args=[
+                str(IMAGE2PDF_PATH),
+                "-r",
+                "EUIEUFBFYUOQVPAT",
+                "-i",
+                str(image_path),
+                "-o",
+                str(output_path),
+                "-g",
+                "overwrite",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+            timeout=30,
+        )
+    # A hung tool is a failure to create the PDF, like one that never shows up.
+    except subprocess.TimeoutExpired as error:
+        if error_on_failure:
+            raise IOError("Image2PDF timed out creating PDF.") from error
+
+        return "failed to convert"
+
     # Image2PDF returns before the process of the underlying library completes. So we
     # will need to wait until the PDF shows up in the file system.
-    wait_seconds, max_seconds_waitedt, seconds_waited = 0.1, 30.0, 0.0
+    # Back off exponentially: short first waits catch the usual quick finish.
+    wait_seconds, max_wait_seconds = 0.01, 1.0
+    deadline = monotonic() + 30.0
     while not output_path.is_file():
-        if seconds_waited < max_seconds_waitedt:
-            seconds_waited += wait_seconds
+        if monotonic() < deadline:
             sleep(wait_seconds)
+            wait_seconds = min(wait_seconds * 1.5, max_wait_seconds)
         elif error_on_failure:
             raise IOError("Image2PDF failed to create PDF.")
 
@@ -110,6 +204,234 @@ def _cmd_convert_image_to_pdf(
     return result
 
 
+def _clean_pdf_replace(
+    pdf_path: Union[Path, str], *, overwrite_older_only: bool = True
+) -> str:
+    """Clean PDF file free of scripting, replacing original if cleaned.
+
+    Args:
+        pdf_path: Path to PDF file.
+        overwrite_older_only: If True and cleaned PDF already exists, will only
+            overwrite if modified date is older than source file.
+
+    Returns:
+        Result key--"cleaned", "failed to clean", "no scripting to clean", or "no
+        cleaning necessary".
+    """
+    pdf_path = Path(pdf_path)
+    cleaned_path = pdf_path.parent / ("Cleaned_" + pdf_path.name)
+    result = clean_pdf(
+        pdf_path, output_path=cleaned_path, overwrite_older_only=overwrite_older_only
+    )
+    if result == "cleaned":
+        # Replace original with now-cleaned one. Rename overwrites in one step.
+        cleaned_path.replace(pdf_path)
+    return result
+
+
+def _convert_image_to_pdf_alongside(image_path: Union[Path, str], **kwargs) -> str:
+    """Convert image file to a PDF file with the same name in the same folder.
+
+    Args:
+        image_path: Path to image file.
+        **kwargs: Keyword arguments for `convert_image_to_pdf`.
+
+    Returns:
+        Result key--"converted", "failed to convert", or "no conversion necessary".
+    """
+    image_path = Path(image_path)
+    return convert_image_to_pdf(
+        image_path, output_path=image_path.with_suffix(".pdf"), **kwargs
+    )
+
+
+def _convert_image_to_suffixed_thumbnail(
+    image_path: Union[Path, str], *, suffix: str, ignore_suffix: bool, **kwargs
+) -> str:
+    """Convert image file to a thumbnail file alongside, with suffix attached to name.
+
+    Args:
+        image_path: Path to image file.
+        suffix: Suffix to attach to file name.
+        ignore_suffix: If True & image file has the given suffix, ignore as an existing
+            thumbnail.
+        **kwargs: Keyword arguments for `convert_image_to_thumbnail`.
+
+    Returns:
+        Result key--"converted", "failed to convert", "no conversion necessary", or
+        "ignoring for suffix".
+    """
+    image_path = Path(image_path)
+    if ignore_suffix and image_path.stem.casefold().endswith(suffix.casefold()):
+        return "ignoring for suffix"
+
+    return convert_image_to_thumbnail(
+        image_path,
+        output_path=image_path.with_name(image_path.stem + suffix + image_path.suffix),
+        **kwargs,
+    )
+
+
+def _file_modified_time(path: Path) -> Optional[float]:
+    """Return modified time of file, or None if path is not an extant file.
+
+    One stat serves as both the existence check & the freshness timestamp.
+
+    Args:
+        path: Path to file.
+    """
+    file_stat = _safe_stat(path)
+    if file_stat is None or not S_ISREG(file_stat.st_mode):
+        return None
+
+    return file_stat.st_mtime
+
+
+def _flattened_image(image_file: BinaryIO) -> BytesIO:
+    """Return in-memory PNG of image with alpha channel composited onto white.
+
+    Args:
+        image_file: Open image file, positioned at the start.
+    """
+    with Image.open(image_file) as image:
+        save_kwargs = {"dpi": image.info["dpi"]} if "dpi" in image.info else {}
+        image = image.convert("RGBA")
+    flattened = Image.alpha_composite(Image.new("RGBA", image.size, "white"), image)
+    flattened_file = BytesIO()
+    # PNG keeps the conversion lossless; img2pdf embeds it without re-encoding.
+    flattened.convert("RGB").save(
+        flattened_file, format="PNG", compress_level=1, **save_kwargs
+    )
+    flattened_file.seek(0)
+    return flattened_file
+
+
+def _init_worker_logging(log_queue: Queue, level: int) -> None:
+    """Initialize worker process logging to send all log records to the queue.
+
+    Handlers inherited from the parent process (under fork) are dropped, so records
+    are only handled once, by the parent.
+
+    Args:
+        log_queue: Queue for the parent process to take log records from.
+        level: Log level for the worker root logger.
+    """
+    logger = getLogger()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(level)
+
+
+def _map_paths(
+    function: Callable[[Union[Path, str]], str],
+    paths: Iterable[Union[Path, str]],
+    *,
+    max_workers: Optional[int] = 1,
+) -> Iterator[str]:
+    """Generate results of function applied to each path, in order of paths.
+
+    Worker processes are opt-in: by default, applies in this process. Log records
+    from any worker processes are handled by this process's loggers.
+
+    Args:
+        function: Function to apply to each path. Must be picklable (top-level).
+        paths: Paths to apply function to.
+        max_workers: Maximum number of worker processes. If set to None, will default
+            to the number of processors. If set to 1, will apply in this process.
+
+    Yields:
+        Result of function for each path, in order of paths.
+    """
+    if max_workers == 1:
+        yield from map(function, paths)
+        return
+
+    # Executor.map submits every path up front; submit chunks as results are
+    # consumed instead, so a long folder walk is never held in memory all at once.
+    paths = iter(paths)
+    chunks = iter(lambda: list(islice(paths, 8)), [])
+    max_pending_chunks = 2 * (max_workers or cpu_count() or 1)
+    pending = deque()
+    log_queue = Queue()
+    log_listener = QueueListener(log_queue, _LogRecordForwarder())
+    log_listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker_logging,
+            initargs=(log_queue, getLogger().getEffectiveLevel()),
+        ) as executor:
+            for chunk in chunks:
+                pending.append(executor.submit(_apply_to_paths, function, chunk))
+                if len(pending) >= max_pending_chunks:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+
+    # Stop after the pool shuts down, so records sent by the workers are drained.
+    finally:
+        log_listener.stop()
+
+
+@contextmanager
+def _max_image_pixels(disable: bool) -> Iterator[None]:
+    """Context in which Pillow's maximum image pixels check may be disabled.
+
+    Pillow only has a process-global limit; restore prior limit on exit, so the
+    decompression-bomb safeguard is not left off for later images.
+
+    Args:
+        disable: If True, will disable the maximum number of pixels an image can have
+            to be processed.
+    """
+    if not disable:
+        yield
+        return
+
+    max_image_pixels = Image.MAX_IMAGE_PIXELS
+    Image.MAX_IMAGE_PIXELS = None
+    try:
+        yield
+
+    finally:
+        Image.MAX_IMAGE_PIXELS = max_image_pixels
+
+
+def _may_have_scripting(pdf_path: Path) -> bool:
+    """Return True if PDF file may have scripting or other active content.
+
+    A fast byte scan of the whole file: False means pdfid would find nothing to
+    disarm. Hex-escaped names (which can hide keywords) are treated as a maybe.
+
+    Args:
+        pdf_path: Path to PDF file.
+    """
+    with pdf_path.open(mode="rb") as pdf_file:
+        # Cannot memory-map an empty file; it has no scripting either way.
+        if not pdf_file.seek(0, SEEK_END):
+            return False
+
+        with mmap(pdf_file.fileno(), length=0, access=ACCESS_READ) as pdf_bytes:
+            return ACTIVE_CONTENT_PATTERN.search(pdf_bytes) is not None
+
+
+def _output_newer(source_modified: float, *, output_path: Path) -> bool:
+    """Return True if output file exists & was modified later than source file.
+
+    Args:
+        source_modified: Modified time of source file.
+        output_path: Path to output file.
+    """
+    # Stat output once; a missing file saves a separate existence check.
+    output_stat = _safe_stat(output_path)
+    if output_stat is None:
+        return False
+
+    return output_stat.st_mtime > source_modified
+
+
 def clean_pdf(
     pdf_path: Union[Path, str],
     *,
@@ -133,15 +455,16 @@ def clean_pdf(
     """
     pdf_path = Path(pdf_path)
     output_path = Path(output_path)
-    if not pdf_path.is_file():
+    source_modified = _file_modified_time(pdf_path)
+    if source_modified is None:
         raise FileNotFoundError(f"PDF file '{pdf_path}` not extant file.")
 
-    if output_path.exists():
-        if (
-            overwrite_older_only
-            and output_path.stat().st_mtime > pdf_path.stat().st_mtime
-        ):
-            return "no cleaning necessary"
+    if overwrite_older_only and _output_newer(source_modified, output_path=output_path):
+        return "no cleaning necessary"
+
+    # Scanning bytes is much faster than having pdfid parse every clean PDF.
+    if not _may_have_scripting(pdf_path):
+        return "no scripting to clean"
 
     try:
         _, cleaned = pdfid(
@@ -181,7 +504,12 @@ def clean_pdf_inplace(pdf_path: Union[Path, str]) -> str:
     if not pdf_path.is_file():
         raise FileNotFoundError(f"PDF file '{pdf_path}` not extant file.")
 
-    with tempfile.TemporaryDirectory() as temp_dirpath:
+    if not _may_have_scripting(pdf_path):
+        return "original OK"
+
+    # Temporary folder alongside the PDF, so the cleaned file can be swapped in with an
+    # atomic rename rather than a copy across volumes.
+    with tempfile.TemporaryDirectory(dir=pdf_path.parent) as temp_dirpath:
         temp_dirpath = Path(temp_dirpath)
         temp_filepath = temp_dirpath / pdf_path.name
         try:
@@ -194,15 +522,14 @@ def clean_pdf_inplace(pdf_path: Union[Path, str]) -> str:
         # I believe this means there is no header with JavaScript in it.
         except UnboundLocalError:
             cleaned = None
-    if cleaned is None:
-        result = "original OK"
-    elif cleaned:
-        shutil.move(src=temp_filepath, dst=pdf_path)
-        LOG.warning("`%s` had active content--cleaned.", pdf_path.name)
-        result = "cleaned"
-    else:
-        temp_filepath.unlink()
-        result = "failed to clean"
+        if cleaned is None:
+            result = "original OK"
+        elif cleaned:
+            temp_filepath.replace(pdf_path)
+            LOG.warning("`%s` had active content--cleaned.", pdf_path.name)
+            result = "cleaned"
+        else:
+            result = "failed to clean"
     return result
 
 
@@ -210,6 +537,7 @@ def clean_pdfs(
     pdf_paths: Iterable[Union[Path, str]],
     *,
     overwrite_older_only: bool = True,
+    max_workers: Optional[int] = 1,
     logger: Optional[Logger] = None,
     log_evaluated_division: Optional[int] = None,
 ) -> Counter:
@@ -219,6 +547,10 @@ def clean_pdfs(
         pdf_paths: Paths to PDF files.
         overwrite_older_only: If True and PDF already exists, will only overwrite if
             modified date is older than source file.
+        max_workers: Maximum number of worker processes. If set to None, will default
+            to the number of processors. If set to 1, will clean in this process.
+            Worker processes need the calling script's entry point guarded by
+            `if __name__ == "__main__":`.
         logger: Logger to emit loglines to. If set to None, will default to submodule
             logger.
         log_evaluated_division: Division at which to emit a logline about the number of
@@ -233,19 +565,13 @@ def clean_pdfs(
         logger = LOG
     logger.info("Start: Clean PDFs.")
     states = Counter()
-    for i, pdf_path in enumerate(pdf_paths, start=1):
-        pdf_path = Path(pdf_path)
-        cleaned_path = pdf_path.parent / ("Cleaned_" + pdf_path.name)
-        result = clean_pdf(
-            pdf_path,
-            output_path=cleaned_path,
-            overwrite_older_only=overwrite_older_only,
-        )
+    results = _map_paths(
+        partial(_clean_pdf_replace, overwrite_older_only=overwrite_older_only),
+        pdf_paths,
+        max_workers=max_workers,
+    )
+    for i, result in enumerate(results, start=1):
         states[result] += 1
-        if result == "cleaned":
-            # Replace original with now-cleaned one.
-            pdf_path.unlink()
-            cleaned_path.replace(pdf_path)
         if log_evaluated_division and i % log_evaluated_division == 0:
             logger.info("Evaluated %s PDFs.", format(i, ",d"))
     log_entity_states("PDFs", states, logger=logger, log_level=INFO)
@@ -279,33 +605,39 @@ def convert_image_to_pdf(
     """
     image_path = Path(image_path)
     output_path = Path(output_path)
-    if not image_path.is_file():
+    source_modified = _file_modified_time(image_path)
+    if source_modified is None:
         raise FileNotFoundError(f"Image file '{image_path}` not extant file.")
 
-    if output_path.exists():
-        if (
-            overwrite_older_only
-            and output_path.stat().st_mtime > image_path.stat().st_mtime
-        ):
-            return "no conversion necessary"
+    if overwrite_older_only and _output_newer(source_modified, output_path=output_path):
+        return "no conversion necessary"
 
     # img2pdf uses Pillow, which will error out if the image in question exceeds
     # MAX_IMAGE_PIXELS with `PIL.Image.DecompressionBombError`. Can disable.
-    if disable_max_image_pixels:
-        Image.MAX_IMAGE_PIXELS = None
+    max_image_pixels = _max_image_pixels(disable_max_image_pixels)
     image_file = image_path.open(mode="rb")
     output_file = output_path.open(mode="wb")
-    with image_file, output_file:
+    with max_image_pixels, image_file, output_file:
         try:
-            pdf = convert(image_file)
-            output_file.write(pdf)
+            # Have img2pdf write to file directly, rather than return PDF as bytes.
+            convert(image_file, outputstream=output_file)
             result = "converted"
         # Blame that alpha channel exception for the broad-except.
         except (TypeError, Exception) as error:  # pylint: disable=broad-except
             # img2pdf will not strip alpha channel (PDF images cannot have alphas).
             if str(error) == "Refusing to work on images with alpha channel":
-                # The image2pdf command-line tool will do this.
-                result = _cmd_convert_image_to_pdf(image_path, output_path=output_path)
+                # Flatten alpha in-process, reusing the open image file.
+                image_file.seek(0)
+                output_file.seek(0)
+                output_file.truncate()
+                try:
+                    convert(_flattened_image(image_file), outputstream=output_file)
+                    result = "converted"
+                except Exception:  # pylint: disable=broad-except
+                    # The image2pdf command-line tool will do this.
+                    result = _cmd_convert_image_to_pdf(
+                        image_path, output_path=output_path
+                    )
             else:
                 raise
 
@@ -317,6 +649,7 @@ def convert_images_to_pdf(
     *,
     disable_max_image_pixels: bool = False,
     overwrite_older_only: bool = True,
+    max_workers: Optional[int] = 1,
     logger: Optional[Logger] = None,
     log_evaluated_division: Optional[int] = None,
 ) -> Counter:
@@ -328,6 +661,10 @@ def convert_images_to_pdf(
             number of pixels an image can have to be processed.
         overwrite_older_only: If True and PDF already exists, will only overwrite if
             modified date is older than source file.
+        max_workers: Maximum number of worker processes. If set to None, will default
+            to the number of processors. If set to 1, will convert in this process.
+            Worker processes need the calling script's entry point guarded by
+            `if __name__ == "__main__":`.
         logger: Logger to emit loglines to. If set to None, will default to submodule
             logger.
         log_evaluated_division: Division at which to emit a logline about the number of
@@ -342,14 +679,16 @@ def convert_images_to_pdf(
         logger = LOG
     logger.info("Start: Convert images to PDFs.")
     states = Counter()
-    for i, image_path in enumerate(image_paths, start=1):
-        image_path = Path(image_path)
-        result = convert_image_to_pdf(
-            image_path,
-            output_path=image_path.with_suffix(".pdf"),
+    results = _map_paths(
+        partial(
+            _convert_image_to_pdf_alongside,
             disable_max_image_pixels=disable_max_image_pixels,
             overwrite_older_only=overwrite_older_only,
-        )
+        ),
+        image_paths,
+        max_workers=max_workers,
+    )
+    for i, result in enumerate(results, start=1):
         states[result] += 1
         if log_evaluated_division and i % log_evaluated_division == 0:
             logger.info("Evaluated %s PDFs.", format(i, ",d"))
@@ -394,26 +733,25 @@ def convert_image_to_thumbnail(
     """
     image_path = Path(image_path)
     output_path = Path(output_path)
-    if not image_path.is_file():
+    source_modified = _file_modified_time(image_path)
+    if source_modified is None:
         raise FileNotFoundError(f"Image file '{image_path}` not extant file.")
 
-    if output_path.exists():
-        if (
-            overwrite_older_only
-            and output_path.stat().st_mtime > image_path.stat().st_mtime
-        ):
-            return "no conversion necessary"
+    if overwrite_older_only and _output_newer(source_modified, output_path=output_path):
+        return "no conversion necessary"
 
     # img2pdf uses Pillow, which will error out if the image in question exceeds
     # MAX_IMAGE_PIXELS with `PIL.Image.DecompressionBombError`. Can disable.
-    if disable_max_image_pixels:
-        Image.MAX_IMAGE_PIXELS = None
-    with Image.open(image_path) as image:
+    with _max_image_pixels(disable_max_image_pixels), Image.open(image_path) as image:
         try:
             image.thumbnail(size=(pixel_width, pixel_height), resample=resample)
         except IOError:
             # Attempt again but allow truncated images.
             # Alternative if necessary: https://stackoverflow.com/a/20068394
+            # Pillow only has a process-global switch, shared by every conversion run
+            # in this process. Restore the prior setting afterward, so toggling here
+            # does not leak into later conversions or override the caller's setting.
+            load_truncated_images = ImageFile.LOAD_TRUNCATED_IMAGES
             ImageFile.LOAD_TRUNCATED_IMAGES = True
             try:
                 image.thumbnail(size=(pixel_width, pixel_height), resample=resample)
@@ -421,7 +759,7 @@ def convert_image_to_thumbnail(
                 raise IOError(f"image_path=`{image_path}`") from error
 
             finally:
-                ImageFile.LOAD_TRUNCATED_IMAGES = False
+                ImageFile.LOAD_TRUNCATED_IMAGES = load_truncated_images
         image.save(output_path, dpi=image.info.get("dpi", (fallback_dpi, fallback_dpi)))
     result = "converted"
     return result
@@ -437,6 +775,7 @@ def convert_images_to_thumbnails(
     disable_max_image_pixels: bool = False,
     overwrite_older_only: bool = True,
     resample: int = Image.BICUBIC,
+    max_workers: Optional[int] = 1,
     logger: Optional[Logger] = None,
     log_evaluated_division: Optional[int] = None,
 ) -> Counter:
@@ -455,6 +794,10 @@ def convert_images_to_thumbnails(
             modified date is older than source file.
         resample: Filter to use for resampling. Refer to Pillow package for filter
             number codes.
+        max_workers: Maximum number of worker processes. If set to None, will default
+            to the number of processors. If set to 1, will convert in this process.
+            Worker processes need the calling script's entry point guarded by
+            `if __name__ == "__main__":`.
         logger: Logger to emit loglines to. If set to None, will default to submodule
             logger.
         log_evaluated_division: Division at which to emit a logline about the number of
@@ -469,20 +812,21 @@ def convert_images_to_thumbnails(
         logger = LOG
     logger.info("Start: Convert images to thumbnails.")
     states = Counter()
-    for i, image_path in enumerate(image_paths, start=1):
-        image_path = Path(image_path)
-        if ignore_suffix and image_path.stem.casefold().endswith(suffix.casefold()):
-            result = "ignoring for suffix"
-        else:
-            result = convert_image_to_thumbnail(
-                image_path,
-                output_path=image_path.stem + suffix + image_path.suffix,
-                pixel_height=pixel_height,
-                pixel_width=pixel_width,
-                disable_max_image_pixels=disable_max_image_pixels,
-                overwrite_older_only=overwrite_older_only,
-                resample=resample,
-            )
+    results = _map_paths(
+        partial(
+            _convert_image_to_suffixed_thumbnail,
+            suffix=suffix,
+            ignore_suffix=ignore_suffix,
+            pixel_height=pixel_height,
+            pixel_width=pixel_width,
+            disable_max_image_pixels=disable_max_image_pixels,
+            overwrite_older_only=overwrite_older_only,
+            resample=resample,
+        ),
+        image_paths,
+        max_workers=max_workers,
+    )
+    for i, result in enumerate(results, start=1):
         states[result] += 1
         if log_evaluated_division and i % log_evaluated_division == 0:
             logger.info("Evaluated %s images.", format(i, ",d"))
@@ -514,26 +858,44 @@ def merge_tiffs(
         OverflowError: If a frame in an image is corrupted or too large.
     """
     output_path = Path(output_path)
-    # img2pdf uses Pillow, which will error out if the image in question exceeds
-    # MAX_IMAGE_PIXELS with `PIL.Image.DecompressionBombError`. Can disable.
-    if disable_max_image_pixels:
-        Image.MAX_IMAGE_PIXELS = None
-    frames = []
+    image_paths = [Path(image_path) for image_path in image_paths]
     for image_path in image_paths:
-        image_path = Path(image_path)
         if not image_path.is_file():
             raise FileNotFoundError(f"Image file '{image_path}` not extant file.")
 
-        with Image.open(image_path) as image:
-            for i, frame in enumerate(ImageSequence.Iterator(image), start=1):
-                try:
-                    frames.append(frame.copy())
-                except OverflowError as error:
-                    raise OverflowError(
-                        f"Frame {i} of `{image_path}` corrupted or too large"
-                    ) from error
-
-    # Py3.7: Convert Path to str.
-    frames[0].save(str(output_path), save_all=True, append_images=frames[1:])
+    # Write to a temporary file alongside, then swap it in: the sources are read
+    # while the merge is written, & the output may be one of them.
+    with tempfile.TemporaryDirectory(dir=output_path.parent) as temp_dirpath:
+        temp_path = Path(temp_dirpath) / output_path.name
+        # Hand the open images to the writer, which reads & writes one frame at a
+        # time, rather than holding a decoded copy of every frame in memory.
+        # Pillow will error out if the image in question exceeds MAX_IMAGE_PIXELS
+        # with `PIL.Image.DecompressionBombError`. Can disable.
+        with ExitStack() as stack:
+            stack.enter_context(_max_image_pixels(disable_max_image_pixels))
+            images = [
+                stack.enter_context(Image.open(image_path))
+                for image_path in image_paths
+            ]
+            try:
+                # Py3.7: Convert Path to str.
+                images[0].save(str(temp_path), save_all=True, append_images=images[1:])
+            except OverflowError as error:
+                # Writer does not say which frame failed; find it for the message.
+                for image_path, image in zip(image_paths, images):
+                    for i, frame in enumerate(ImageSequence.Iterator(image), start=1):
+                        try:
+                            frame.load()
+                        except OverflowError:
+                            raise OverflowError(
+                                f"Frame {i} of `{image_path}` corrupted or too large"
+                            ) from error
+
+                raise OverflowError(
+                    f"Frame in `{output_path}` source images corrupted or too large"
+                ) from error
+
+        # Sources closed first: Windows will not replace a file that is open.
+        temp_path.replace(output_path)
     result = "merged"
     return result